@@ -0,0 +1,44 @@
+"""Store urls.created_at as timestamptz
+
+Revision ID: 002_created_at_timestamptz
+Revises: 001_initial
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_created_at_timestamptz'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert created_at to a timezone-aware column.
+
+    asyncpg refuses timezone-aware parameters for naive timestamp columns,
+    and existing values were always written in UTC.
+    """
+    op.alter_column(
+        'urls',
+        'created_at',
+        type_=sa.DateTime(timezone=True),
+        existing_nullable=False,
+        postgresql_using="created_at AT TIME ZONE 'UTC'",
+    )
+
+
+def downgrade() -> None:
+    """Convert created_at back to a naive UTC timestamp."""
+    op.alter_column(
+        'urls',
+        'created_at',
+        type_=sa.DateTime(),
+        existing_nullable=False,
+        postgresql_using="created_at AT TIME ZONE 'UTC'",
+    )
@@ -0,0 +1,28 @@
+"""Add index on urls.created_at
+
+Revision ID: 003_created_at_index
+Revises: 002_created_at_timestamptz
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003_created_at_index'
+down_revision: Union[str, None] = '002_created_at_timestamptz'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index created_at so expiration filters use a range scan."""
+    op.create_index(op.f('ix_urls_created_at'), 'urls', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop created_at index."""
+    op.drop_index(op.f('ix_urls_created_at'), table_name='urls')
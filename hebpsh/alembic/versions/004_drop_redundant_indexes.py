@@ -0,0 +1,30 @@
+"""Drop redundant indexes on urls
+
+Revision ID: 004_drop_redundant_indexes
+Revises: 003_created_at_index
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004_drop_redundant_indexes'
+down_revision: Union[str, None] = '003_created_at_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop indexes duplicated by the primary key and the unique short_code index."""
+    op.drop_index('idx_short_code', table_name='urls')
+    op.drop_index(op.f('ix_urls_id'), table_name='urls')
+
+
+def downgrade() -> None:
+    """Recreate the dropped indexes."""
+    op.create_index(op.f('ix_urls_id'), 'urls', ['id'], unique=False)
+    op.create_index('idx_short_code', 'urls', ['short_code'], unique=False)
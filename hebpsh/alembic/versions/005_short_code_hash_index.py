@@ -0,0 +1,34 @@
+"""Add hash index on urls.short_code
+
+Revision ID: 005_short_code_hash_index
+Revises: 004_drop_redundant_indexes
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005_short_code_hash_index'
+down_revision: Union[str, None] = '004_drop_redundant_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create hash index for equality lookups by short code."""
+    op.create_index(
+        'ix_urls_short_code_hash',
+        'urls',
+        ['short_code'],
+        unique=False,
+        postgresql_using='hash',
+    )
+
+
+def downgrade() -> None:
+    """Drop short_code hash index."""
+    op.drop_index('ix_urls_short_code_hash', table_name='urls')
@@ -0,0 +1,40 @@
+"""Default urls.created_at to the database clock
+
+Revision ID: 006_created_at_server_default
+Revises: 005_short_code_hash_index
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_created_at_server_default'
+down_revision: Union[str, None] = '005_short_code_hash_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Set created_at server default to now()."""
+    op.alter_column(
+        'urls',
+        'created_at',
+        server_default=sa.func.now(),
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove created_at server default."""
+    op.alter_column(
+        'urls',
+        'created_at',
+        server_default=None,
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+    )
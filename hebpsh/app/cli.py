@@ -1,11 +1,25 @@
 """CLI commands for managing the URL shortener."""
+import asyncio
 import click
-from sqlalchemy.orm import Session
-from app.config.database import SessionLocal
+from app.config.database import SessionLocal, engine
 from app.repositories.url_repository import URLRepository
 from app.services.url_service import URLService
 
 
+async def _cleanup_expired() -> int:
+    """Run expired URL cleanup in its own session.
+    
+    Returns:
+        int: Number of deleted URLs
+    """
+    try:
+        async with SessionLocal() as db:
+            service = URLService(URLRepository())
+            return await service.cleanup_expired_urls(db)
+    finally:
+        await engine.dispose()
+
+
 @click.group()
 def cli():
     """URL Shortener CLI."""
@@ -15,16 +29,11 @@ def cli():
 @cli.command()
 def cleanup_expired():
     """Delete all expired URLs based on TTL setting."""
-    db: Session = SessionLocal()
     try:
-        repository = URLRepository(db)
-        service = URLService(repository)
-        count = service.cleanup_expired_urls()
+        count = asyncio.run(_cleanup_expired())
         click.echo(f"Successfully deleted {count} expired URL(s)")
     except Exception as e:
         click.echo(f"Error cleaning up expired URLs: {str(e)}", err=True)
-    finally:
-        db.close()
 
 
 if __name__ == "__main__":
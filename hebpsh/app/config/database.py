@@ -1,27 +1,55 @@
 """Database configuration and session management."""
-from sqlalchemy import create_engine
+from typing import AsyncIterator
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
 from app.config.settings import settings
 
+
+def get_async_database_url(database_url: str) -> URL:
+    """Build the async driver URL for the configured database.
+    
+    DATABASE_URL is shared with Alembic, which runs migrations through the
+    synchronous psycopg2 driver, so the asyncpg driver is selected here.
+    
+    Args:
+        database_url: Database connection string from settings
+        
+    Returns:
+        URL: Connection URL using the asyncpg driver for PostgreSQL
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "postgresql":
+        url = url.set(drivername="postgresql+asyncpg")
+    return url
+
+
 # Create database engine
-engine = create_engine(settings.DATABASE_URL)
+# Connections are pooled and checked with a lightweight ping on checkout so
+# stale connections are replaced instead of failing the request
+engine = create_async_engine(
+    get_async_database_url(settings.DATABASE_URL),
+    pool_size=settings.APP_DB_POOL_SIZE,
+    max_overflow=settings.APP_DB_MAX_OVERFLOW,
+    pool_timeout=settings.APP_DB_POOL_TIMEOUT,
+    pool_recycle=settings.APP_DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+)
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Objects stay loaded after commit so responses can be built without
+# triggering a lazy refresh outside of an awaitable context
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 # Create base class for models
 Base = declarative_base()
 
 
-def get_db() -> Session:
+async def get_db() -> AsyncIterator[AsyncSession]:
     """Get database session.
     
     Yields:
-        Session: Database session
+        AsyncSession: Database session
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
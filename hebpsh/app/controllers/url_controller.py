@@ -1,15 +1,17 @@
 """URL controllers/routers for handling HTTP requests."""
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import RedirectResponse, JSONResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from app.config.database import get_db
+from app.config.settings import settings
 from app.repositories.url_repository import URLRepository
 from app.services.url_service import URLService
 from app.schemas.url import (
     URLCreate,
     URLResponse,
+    APIResponse,
     URLCreateResponse,
     URLListResponse,
     ErrorResponse
@@ -17,18 +19,9 @@ from app.schemas.url import (
 
 router = APIRouter()
 
-
-def get_url_service(db: Session = Depends(get_db)) -> URLService:
-    """Dependency injection for URL service.
-    
-    Args:
-        db: Database session
-        
-    Returns:
-        URLService: URL service instance
-    """
-    repository = URLRepository(db)
-    return URLService(repository)
+# Repository and service are stateless, so a single instance serves every
+# request; only the database session is resolved per request.
+url_service = URLService(URLRepository())
 
 
 @router.post(
@@ -44,7 +37,7 @@ def get_url_service(db: Session = Depends(get_db)) -> URLService:
 )
 async def create_short_url(
     url_data: URLCreate,
-    service: URLService = Depends(get_url_service)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a short URL.
     
@@ -53,7 +46,7 @@ async def create_short_url(
     
     Args:
         url_data: URL creation data
-        service: URL service instance
+        db: Database session
         
     Returns:
         URLCreateResponse: Created URL information
@@ -62,21 +55,13 @@ async def create_short_url(
         HTTPException: If URL creation fails
     """
     try:
-        # Convert HttpUrl to string for storage
-        url = service.create_short_url(str(url_data.original_url))
-        return JSONResponse(
-            status_code=status.HTTP_201_CREATED,
-            content={
-                "status": "success",
-                "message": "Short URL created successfully",
-                "data": {
-                    "id": url.id,
-                    "original_url": url.original_url,
-                    "short_code": url.short_code,
-                    "created_at": url.created_at.isoformat()
-                }
-            }
-        )
+        url = await url_service.create_short_url(db, url_data.original_url)
+        # Serialized by the response model straight to JSON bytes
+        return {
+            "status": "success",
+            "message": "Short URL created successfully",
+            "data": url
+        }
     except ValueError as e:
         return JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -98,6 +83,7 @@ async def create_short_url(
 @router.get(
     "/u/{code}",
     responses={
+        301: {"description": "Permanent redirect to original URL (APP_REDIRECT_STATUS_CODE=301)"},
         302: {"description": "Redirect to original URL"},
         307: {"description": "Temporary redirect to original URL"},
         404: {"model": ErrorResponse, "description": "URL not found"},
@@ -106,7 +92,7 @@ async def create_short_url(
 )
 async def redirect_to_url(
     code: str,
-    service: URLService = Depends(get_url_service)
+    db: AsyncSession = Depends(get_db)
 ):
     """Redirect to original URL using short code.
     
@@ -115,20 +101,21 @@ async def redirect_to_url(
     
     The system retrieves the short code from the path and searches for it in the database.
     - If the link is found and not expired, redirect to original URL with HTTP 302
+      (or 301 if configured), cacheable until the link expires
     - If the link is not found or expired, return 404 with status=failure and message
     
     Args:
         code: Short code
-        service: URL service instance
+        db: Database session
         
     Returns:
-        RedirectResponse: Redirect to original URL (302/307)
+        RedirectResponse: Redirect to original URL (301/302)
         JSONResponse: Error response if not found (404) or server error (500)
     """
     try:
-        url = service.get_url_by_code(code)
+        target = await url_service.get_redirect_target(db, code)
         
-        if not url:
+        if not target:
             return JSONResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content={
@@ -137,8 +124,16 @@ async def redirect_to_url(
                 }
             )
         
-        # HTTP 302 for successful redirect (temporary redirect)
-        return RedirectResponse(url=url.original_url, status_code=status.HTTP_302_FOUND)
+        # HTTP 302 for successful redirect (temporary redirect) unless configured otherwise
+        # Cache headers let browsers and CDNs serve repeat clicks without hitting the service;
+        # uncacheable redirects say so explicitly, since browsers keep a bare 301 forever
+        max_age = url_service.get_redirect_max_age(target)
+        cache_control = f"public, max-age={max_age}" if max_age > 0 else "no-store"
+        return RedirectResponse(
+            url=target.original_url,
+            status_code=settings.APP_REDIRECT_STATUS_CODE,
+            headers={"Cache-Control": cache_control}
+        )
     except Exception as e:
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -158,7 +153,7 @@ async def redirect_to_url(
     }
 )
 async def get_all_urls(
-    service: URLService = Depends(get_url_service)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get all shortened URLs.
     
@@ -166,29 +161,19 @@ async def get_all_urls(
     Returns only non-expired URLs (based on TTL configuration).
     
     Args:
-        service: URL service instance
+        db: Database session
         
     Returns:
         URLListResponse: List of all valid (non-expired) URLs
     """
     try:
-        urls = service.get_all_urls()
-        return JSONResponse(
-            status_code=status.HTTP_200_OK,
-            content={
-                "status": "success",
-                "message": f"Retrieved {len(urls)} URL(s)",
-                "data": [
-                    {
-                        "id": url.id,
-                        "original_url": url.original_url,
-                        "short_code": url.short_code,
-                        "created_at": url.created_at.isoformat()
-                    }
-                    for url in urls
-                ]
-            }
-        )
+        # Build the response models while streaming so ORM objects are not all held at once
+        urls = [URLResponse.model_validate(url) async for url in url_service.get_all_urls(db)]
+        return {
+            "status": "success",
+            "message": f"Retrieved {len(urls)} URL(s)",
+            "data": urls
+        }
     except Exception as e:
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -201,6 +186,8 @@ async def get_all_urls(
 
 @router.delete(
     "/urls/{code}",
+    response_model=APIResponse,
+    response_model_exclude_none=True,
     responses={
         200: {"description": "URL deleted successfully"},
         404: {"model": ErrorResponse, "description": "URL not found"},
@@ -209,7 +196,7 @@ async def get_all_urls(
 )
 async def delete_url(
     code: str,
-    service: URLService = Depends(get_url_service)
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a shortened URL.
     
@@ -217,13 +204,13 @@ async def delete_url(
     
     Args:
         code: Short code of URL to delete
-        service: URL service instance
+        db: Database session
         
     Returns:
-        JSON response with deletion status
+        APIResponse: Deletion status
     """
     try:
-        deleted = service.delete_url(code)
+        deleted = await url_service.delete_url(db, code)
         
         if not deleted:
             return JSONResponse(
@@ -234,13 +221,10 @@ async def delete_url(
                 }
             )
         
-        return JSONResponse(
-            status_code=status.HTTP_200_OK,
-            content={
-                "status": "success",
-                "message": f"URL with short code '{code}' deleted successfully"
-            }
-        )
+        return {
+            "status": "success",
+            "message": f"URL with short code '{code}' deleted successfully"
+        }
     except Exception as e:
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,26 +1,118 @@
 """Main application module."""
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import ValidationError
-from app.controllers.url_controller import router as url_router
+from app.config.database import SessionLocal, engine
+from app.config.settings import settings
+from app.controllers.url_controller import router as url_router, url_service
+
+logger = logging.getLogger(__name__)
+
+
+async def run_periodic_cleanup(interval_minutes: int) -> None:
+    """Delete expired URLs every interval until cancelled.
+    
+    Read paths only filter expired URLs out, so this keeps the table from
+    growing without relying on an external cron job.
+    
+    Args:
+        interval_minutes: Minutes between cleanup runs
+    """
+    while True:
+        await asyncio.sleep(interval_minutes * 60)
+        try:
+            async with SessionLocal() as db:
+                count = await url_service.cleanup_expired_urls(db)
+            logger.info("Deleted %d expired URL(s)", count)
+        except Exception:
+            logger.exception("Periodic cleanup of expired URLs failed")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background cleanup on startup and release resources on shutdown."""
+    cleanup_task = None
+    if url_service.ttl_enabled and settings.APP_CLEANUP_INTERVAL_MINUTES > 0:
+        cleanup_task = asyncio.create_task(
+            run_periodic_cleanup(settings.APP_CLEANUP_INTERVAL_MINUTES)
+        )
+    yield
+    if cleanup_task is not None:
+        cleanup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await cleanup_task
+    await engine.dispose()
+
 
 # Create FastAPI application
 app = FastAPI(
     title="URL Shortener API",
     description="A RESTful URL shortening service built with FastAPI with TTL support",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# Add CORS middleware to allow Swagger UI redirects
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with specific origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Add CORS middleware only when cross-origin browser clients are configured;
+# same-origin requests (including Swagger UI) don't need it
+if settings.APP_CORS_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.APP_CORS_ORIGINS,
+        allow_credentials=False,
+        allow_methods=["GET", "POST", "DELETE"],
+        allow_headers=["Content-Type"],
+    )
+
+
+URL_FORMAT_MESSAGE = "Must be a valid URL with proper format (e.g., https://example.com)"
+
+
+def _format_value_error(error: dict, field: str, msg: str) -> str:
+    """Use the message raised by a custom validator."""
+    custom_error = error.get("ctx", {}).get("error")
+    if custom_error is None:
+        return _format_default_error(error, field, msg)
+    return custom_error.args[0] if custom_error.args else str(custom_error)
+
+
+def _format_url_error(error: dict, field: str, msg: str) -> str:
+    """Use a single friendly message for URL parsing errors."""
+    return URL_FORMAT_MESSAGE
+
+
+def _format_url_pattern_error(error: dict, field: str, msg: str) -> str:
+    """Use the URL message for the URL field's pattern, the default elsewhere."""
+    if field == "original_url":
+        return URL_FORMAT_MESSAGE
+    return _format_default_error(error, field, msg)
+
+
+def _format_missing_error(error: dict, field: str, msg: str) -> str:
+    """Name the missing field."""
+    return f"{field}: This field is required"
+
+
+def _format_default_error(error: dict, field: str, msg: str) -> str:
+    """Use the message from Pydantic without its "Value error, " prefix."""
+    return msg.removeprefix("Value error, ")
+
+
+# Formatter for each Pydantic error type, looked up once per error
+ERROR_FORMATTERS = {
+    "value_error": _format_value_error,
+    "missing": _format_missing_error,
+    "string_pattern_mismatch": _format_url_pattern_error,
+    "url_type": _format_url_error,
+    "url_parsing": _format_url_error,
+    "url_scheme": _format_url_error,
+    "url_syntax_violation": _format_url_error,
+    "url_too_long": _format_url_error,
+}
 
 
 # Global exception handler for validation errors
@@ -30,34 +122,13 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     
     Returns a user-friendly error message for invalid URL format or missing fields.
     """
-    errors = exc.errors()
     error_messages = []
     
-    for error in errors:
-        field = error.get("loc", [])[-1] if error.get("loc") else "field"
-        msg = error.get("msg", "Invalid input")
-        error_type = error.get("type", "")
-        
-        # Extract custom error message from context if available (for custom validators)
-        if error_type == "value_error" and "ctx" in error and "error" in error["ctx"]:
-            # Custom validator error - extract the actual message
-            custom_error = str(error["ctx"]["error"])
-            # Remove "ValueError('" prefix and "')" suffix if present
-            if custom_error.startswith("ValueError('") and custom_error.endswith("')"):
-                custom_error = custom_error[12:-2]
-            elif custom_error.startswith("ValueError(") and custom_error.endswith(")"):
-                custom_error = custom_error[11:-1]
-            error_messages.append(custom_error)
-        elif "url" in error_type or "url_parsing" in error_type:
-            error_messages.append("Must be a valid URL with proper format (e.g., https://example.com)")
-        elif "missing" in error_type:
-            error_messages.append(f"{field}: This field is required")
-        else:
-            # For other errors, use the message from Pydantic
-            # Remove "Value error, " prefix if present
-            if msg.startswith("Value error, "):
-                msg = msg[13:]
-            error_messages.append(msg)
+    for error in exc.errors():
+        loc = error.get("loc")
+        field = loc[-1] if loc else "field"
+        formatter = ERROR_FORMATTERS.get(error.get("type", ""), _format_default_error)
+        error_messages.append(formatter(error, field, error.get("msg", "Invalid input")))
     
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -1,29 +1,21 @@
 """Database models for the application."""
-from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, DateTime, Index
+from sqlalchemy import Column, Integer, String, DateTime, Index, func
 from app.config.database import Base
 
 
-def get_utc_now() -> datetime:
-    """Get current UTC time with timezone awareness.
-    
-    Returns:
-        datetime: Current UTC time
-    """
-    return datetime.now(timezone.utc)
-
-
 class URL(Base):
     """URL model representing shortened URLs in the database."""
     
     __tablename__ = "urls"
     
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
     original_url = Column(String, nullable=False)
+    # The unique index on short_code enforces uniqueness; lookups use the hash index below
     short_code = Column(String(10), unique=True, nullable=False, index=True)
-    created_at = Column(DateTime, default=get_utc_now, nullable=False)
+    # Set by the database (transaction timestamp) so inserts don't send it
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     
-    # Create index on short_code for faster lookups
+    # Short codes are only ever matched by equality, which a hash index serves directly
     __table_args__ = (
-        Index('idx_short_code', 'short_code'),
+        Index('ix_urls_short_code_hash', 'short_code', postgresql_using='hash'),
     )
@@ -1,124 +1,209 @@
 """Repository layer for URL operations."""
-from typing import List, Optional
-from datetime import datetime, timedelta, timezone
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from typing import AsyncIterator, Optional
+from datetime import timedelta
+from sqlalchemy import ColumnElement, Row, delete, exists, func, null, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.url import URL
 
 
-def get_current_utc_time() -> datetime:
-    """Get current UTC time with timezone awareness.
+def calculate_expiration_time(ttl_minutes: int) -> ColumnElement:
+    """Build the expiration timestamp based on TTL as a SQL expression.
     
-    Returns:
-        datetime: Current UTC time with timezone info
-    """
-    return datetime.now(timezone.utc)
-
-
-def calculate_expiration_time(ttl_minutes: int) -> datetime:
-    """Calculate expiration timestamp based on TTL.
+    The database evaluates it as now() - TTL, on the same clock that sets
+    created_at, so application server clock skew can't expire URLs early
+    or late.
     
     Args:
         ttl_minutes: Time to live in minutes
         
     Returns:
-        datetime: Expiration timestamp (current time - TTL)
+        ColumnElement: Expiration timestamp expression (current time - TTL)
     """
-    return get_current_utc_time() - timedelta(minutes=ttl_minutes)
+    return func.now() - timedelta(minutes=ttl_minutes)
 
 
 class URLRepository:
-    """Repository for URL database operations."""
+    """Repository for URL database operations.
     
-    def __init__(self, db: Session):
-        """Initialize repository with database session.
-        
-        Args:
-            db: Database session
-        """
-        self.db = db
+    The repository holds no per-request state; the database session is
+    passed to each method so a single instance can be shared process-wide.
+    """
     
-    def create(self, original_url: str, short_code: str) -> URL:
+    async def create(self, db: AsyncSession, original_url: str, short_code: str) -> Optional[URL]:
         """Create a new URL entry.
         
+        A taken short code is reported through ON CONFLICT DO NOTHING
+        instead of a prior existence check, and the generated id and
+        created_at come back through RETURNING, so this is a single
+        round-trip.
+        
         Args:
+            db: Database session
             original_url: The original URL
             short_code: The generated short code
             
         Returns:
-            URL: Created URL object
+            Optional[URL]: Created URL object (not attached to the session),
+            or None if the short code is already taken
         """
-        db_url = URL(
+        result = await db.execute(
+            insert(URL)
+            .values(original_url=original_url, short_code=short_code)
+            .on_conflict_do_nothing(index_elements=[URL.short_code])
+            .returning(URL.id, URL.created_at)
+        )
+        row = result.first()
+        await db.commit()
+        if row is None:
+            return None
+        return URL(
+            id=row.id,
             original_url=original_url,
             short_code=short_code,
-            created_at=get_current_utc_time()
+            created_at=row.created_at
         )
-        self.db.add(db_url)
-        self.db.commit()
-        self.db.refresh(db_url)
-        return db_url
     
-    def get_by_short_code(self, short_code: str) -> Optional[URL]:
+    async def get_by_short_code(self, db: AsyncSession, short_code: str) -> Optional[URL]:
         """Get URL by short code.
         
         Args:
+            db: Database session
             short_code: The short code to search for
             
         Returns:
             Optional[URL]: URL object if found, None otherwise
         """
-        return self.db.query(URL).filter(URL.short_code == short_code).first()
+        return await db.scalar(select(URL).where(URL.short_code == short_code))
     
-    def get_all(self) -> List[URL]:
-        """Get all URLs.
+    async def get_redirect_target(
+        self, db: AsyncSession, short_code: str, ttl_minutes: Optional[int] = None
+    ) -> Optional[Row]:
+        """Get only the columns needed to redirect a short code.
+        
+        Selecting plain columns skips building and tracking a URL object.
+        The time left before expiry is computed on the database clock, the
+        same one the expiry filter uses, so callers never compare
+        created_at against the application server's clock.
         
+        Args:
+            db: Database session
+            short_code: The short code to search for
+            ttl_minutes: If given, ignore URLs older than this many minutes
+            
         Returns:
-            List[URL]: List of all URL objects
+            Optional[Row]: Row with original_url and expires_in (seconds left
+            before expiry, None without a TTL) if found, None otherwise
         """
-        return self.db.query(URL).all()
+        if ttl_minutes is None:
+            expires_in = null()
+        else:
+            expires_in = func.extract('epoch', URL.created_at - calculate_expiration_time(ttl_minutes))
+        statement = (
+            select(URL.original_url, expires_in.label('expires_in'))
+            .where(URL.short_code == short_code)
+        )
+        if ttl_minutes is not None:
+            statement = statement.where(URL.created_at >= calculate_expiration_time(ttl_minutes))
+        result = await db.execute(statement)
+        return result.first()
+    
+    async def stream_all(
+        self, db: AsyncSession, ttl_minutes: Optional[int] = None, batch_size: int = 1000
+    ) -> AsyncIterator[URL]:
+        """Stream all URLs using a server-side cursor.
+        
+        Rows are fetched and converted to URL objects in batches, so the
+        full result set is never buffered at once. Ordering by created_at
+        lets the TTL cutoff and the sort share one range scan of the
+        created_at index.
+        
+        Args:
+            db: Database session
+            ttl_minutes: If given, skip URLs older than this many minutes
+            batch_size: Number of rows fetched per round-trip
+            
+        Yields:
+            URL: URL objects, newest first
+        """
+        statement = (
+            select(URL)
+            .order_by(URL.created_at.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        if ttl_minutes is not None:
+            statement = statement.where(URL.created_at >= calculate_expiration_time(ttl_minutes))
+        result = await db.stream_scalars(statement)
+        async for url in result:
+            yield url
     
-    def delete_by_short_code(self, short_code: str) -> bool:
+    async def delete_by_short_code(self, db: AsyncSession, short_code: str) -> bool:
         """Delete URL by short code.
         
         Args:
+            db: Database session
             short_code: The short code of the URL to delete
             
         Returns:
             bool: True if deleted, False if not found
         """
-        url = self.get_by_short_code(short_code)
+        url = await self.get_by_short_code(db, short_code)
         if url:
-            self.db.delete(url)
-            self.db.commit()
+            await db.delete(url)
+            await db.commit()
             return True
         return False
     
-    def short_code_exists(self, short_code: str) -> bool:
+    async def short_code_exists(self, db: AsyncSession, short_code: str) -> bool:
         """Check if a short code already exists.
         
         Args:
+            db: Database session
             short_code: The short code to check
             
         Returns:
             bool: True if exists, False otherwise
         """
-        return self.db.query(URL).filter(URL.short_code == short_code).count() > 0
+        # EXISTS lets the database stop at the first matching index entry
+        return await db.scalar(select(exists().where(URL.short_code == short_code)))
     
-    def delete_expired(self, ttl_minutes: int) -> int:
+    async def delete_expired(self, db: AsyncSession, ttl_minutes: int, batch_size: int = 10000) -> int:
         """Delete URLs that have expired based on TTL.
         
+        Rows are deleted in batches, each committed on its own, so a large
+        backlog never holds locks or grows a single transaction unbounded.
+        
         Args:
+            db: Database session
             ttl_minutes: Time to live in minutes
+            batch_size: Maximum number of rows deleted per transaction
             
         Returns:
             int: Number of deleted records
+            
+        Raises:
+            ValueError: If batch_size is less than 1
         """
-        expiration_time = calculate_expiration_time(ttl_minutes)
-        expired_urls = self.db.query(URL).filter(URL.created_at < expiration_time).all()
-        count = len(expired_urls)
+        # LIMIT 0 would never delete anything and the loop would never end
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
         
-        for url in expired_urls:
-            self.db.delete(url)
+        expiration_time = calculate_expiration_time(ttl_minutes)
+        expired_ids = (
+            select(URL.id)
+            .where(URL.created_at < expiration_time)
+            .limit(batch_size)
+        )
+        statement = (
+            delete(URL)
+            .where(URL.id.in_(expired_ids))
+            .execution_options(synchronize_session=False)
+        )
         
-        self.db.commit()
-        return count
+        total = 0
+        while True:
+            result = await db.execute(statement)
+            await db.commit()
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                return total
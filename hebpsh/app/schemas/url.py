@@ -1,56 +1,94 @@
 """Pydantic schemas for request and response validation."""
 from datetime import datetime
 from typing import Optional, Literal
-from pydantic import BaseModel, HttpUrl, Field, field_validator
-import re
+from urllib.parse import urlsplit
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+# Scheme (any case, as schemes are case-insensitive) followed by up to 2048
+# non-whitespace characters
+# Matched by pydantic-core, which compiles the pattern once per process
+URL_PATTERN = r'^(?i:https?)://[^\s]{1,2048}$'
+# Hosts accepted without a top-level domain
+LOCAL_HOSTS = frozenset({'localhost', '127.0.0.1'})
 
 
 class URLCreate(BaseModel):
     """Schema for creating a new short URL."""
-    original_url: HttpUrl = Field(..., description="The original URL to shorten (must be a valid URL starting with http:// or https://)")
+    original_url: str = Field(
+        ...,
+        pattern=URL_PATTERN,
+        description="The original URL to shorten (must be a valid URL starting with http:// or https://)"
+    )
     
     @field_validator('original_url')
     @classmethod
     def validate_url_format(cls, v):
-        """Additional validation for URL format.
+        """Validate URL format.
+        
+        The URL is kept as the submitted string, so no URL object is built
+        and converted back to text for storage. The scheme and whitespace
+        checks run earlier, through the field's URL_PATTERN constraint.
+        Only the scheme is lowercased and an internationalized host is
+        IDNA-encoded, so "HTTPS://bücher.de/x" is stored as
+        "https://xn--bcher-kva.de/x".
         
         Ensures:
-        - URL has a valid scheme (http/https)
         - URL has a valid domain with proper TLD
+        - URL port, if present, is a number from 0 to 65535
         - URL doesn't end with just a slash after domain
         - URL path is complete if present
         """
-        url_str = str(v)
+        url_str = v
         
-        # Extract domain from URL (between scheme and first slash or end)
-        domain_match = re.match(r'https?://([^/]+)', url_str)
-        if not domain_match:
+        # Extract the host; urlsplit drops any userinfo and port, so
+        # "https://localhost:8000" and "https://user@example.com" are accepted
+        try:
+            parts = urlsplit(url_str)
+            domain = parts.hostname or ''
+        except ValueError:
+            # Malformed netloc, e.g. an unclosed IPv6 bracket
             raise ValueError("URL must have a valid domain")
-        
-        domain = domain_match.group(1)
+        if not domain:
+            raise ValueError("URL must have a valid domain")
+        try:
+            # Reading the port validates it (digits, 0-65535)
+            parts.port
+        except ValueError:
+            raise ValueError("URL must have a valid port")
         
         # Check if domain has at least one dot for TLD (e.g., example.com)
-        # Allow localhost and IP addresses as special cases
-        if domain not in ['localhost', '127.0.0.1'] and not re.match(r'^\d+\.\d+\.\d+\.\d+$', domain):
+        # Allow localhost and IPv4 addresses as special cases
+        labels = domain.split('.')
+        is_ipv4 = len(labels) == 4 and all(label.isdigit() for label in labels)
+        if domain not in LOCAL_HOSTS and not is_ipv4:
             if '.' not in domain:
                 raise ValueError("URL must have a valid top-level domain (e.g., .com, .org, .net)")
             
             # Check if TLD is at least 2 characters
-            tld = domain.split('.')[-1]
+            tld = labels[-1]
             if len(tld) < 2:
                 raise ValueError("URL must have a valid top-level domain")
         
         # Check for incomplete URLs like "https://github./" or "https://example.com/"
         # Allow root URLs but prevent obvious incomplete paths
-        if url_str.endswith('/.') or url_str.endswith('//'):
+        if url_str.endswith(('/.', '//')):
             raise ValueError("URL path appears incomplete or malformed")
         
-        # Check for suspicious patterns that indicate incomplete URLs
-        path_after_domain = url_str[len(f"{domain_match.group(0)}"):]
-        if path_after_domain == '/.':
-            raise ValueError("URL path is incomplete")
+        # URL_PATTERN guarantees "scheme://", so the netloc starts right after it
+        netloc = parts.netloc
+        rest = url_str[len(parts.scheme) + 3 + len(netloc):]
+        if not domain.isascii():
+            try:
+                ascii_domain = domain.encode('idna').decode('ascii')
+            except UnicodeError:
+                raise ValueError("URL must have a valid domain")
+            userinfo, at, _ = netloc.rpartition('@')
+            port = '' if parts.port is None else f":{parts.port}"
+            netloc = f"{userinfo}{at}{ascii_domain}{port}"
         
-        return v
+        # urlsplit has already lowercased the scheme
+        return f"{parts.scheme}://{netloc}{rest}"
 
 
 class URLResponse(BaseModel):
@@ -60,8 +98,7 @@ class URLResponse(BaseModel):
     short_code: str
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class APIResponse(BaseModel):
@@ -1,11 +1,44 @@
 """Service layer for URL operations."""
-from typing import List, Optional
+import time
+from typing import AsyncIterator, NamedTuple, Optional
+from cachetools import Cache, TLRUCache, TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.url import URL
 from app.repositories.url_repository import URLRepository
-from app.services.utils import generate_short_code, is_url_expired
+from app.services.utils import generate_short_code
 from app.config.settings import settings
 
 
+class RedirectTarget(NamedTuple):
+    """Where a short code redirects to, and until when."""
+    original_url: str
+    # time.time() at which the URL expires, None if it never does
+    expires_at: Optional[float]
+
+
+def build_url_cache() -> Optional[Cache]:
+    """Build the short code lookup cache from settings.
+    
+    Deleting a URL only evicts it on the worker that handled the delete,
+    so entries are also dropped after APP_REDIRECT_CACHE_SECONDS, the same
+    staleness already allowed for browser and CDN caches. Entries never
+    outlive their URL, so a cache hit needs no expiry check of its own.
+    
+    Returns:
+        Optional[Cache]: Cache instance, or None if caching is disabled
+    """
+    max_stale = settings.APP_REDIRECT_CACHE_SECONDS
+    if settings.APP_URL_CACHE_SIZE <= 0 or max_stale <= 0:
+        return None
+    if settings.APP_TTL_MINUTES > 0:
+        return TLRUCache(
+            maxsize=settings.APP_URL_CACHE_SIZE,
+            ttu=lambda _key, target, now: min(target.expires_at, now + max_stale),
+            timer=time.time
+        )
+    return TTLCache(maxsize=settings.APP_URL_CACHE_SIZE, ttl=max_stale)
+
+
 class URLService:
     """Service for URL business logic."""
     
@@ -16,11 +49,19 @@ class URLService:
             repository: URL repository instance
         """
         self.repository = repository
+        self.url_cache = build_url_cache()
+        # Bumped on every eviction; a lookup only caches its result if no
+        # eviction happened while its query was in flight
+        self._cache_generation = 0
+        # APP_TTL_MINUTES=0 disables expiration; decided once so the
+        # read paths can skip expiry checks entirely
+        self.ttl_enabled = settings.APP_TTL_MINUTES > 0
     
-    def create_short_url(self, original_url: str) -> URL:
+    async def create_short_url(self, db: AsyncSession, original_url: str) -> URL:
         """Create a short URL.
         
         Args:
+            db: Database session
             original_url: The original URL to shorten
             
         Returns:
@@ -33,66 +74,122 @@ class URLService:
         if not original_url or len(original_url.strip()) == 0:
             raise ValueError("URL cannot be empty")
         
-        # Generate unique short code
+        # Generate unique short code; the unique index rejects the rare collision
         max_attempts = 10
         for _ in range(max_attempts):
-            short_code = generate_short_code()
-            if not self.repository.short_code_exists(short_code):
-                return self.repository.create(original_url, short_code)
+            url = await self.repository.create(db, original_url, generate_short_code())
+            if url is not None:
+                return url
         
         raise ValueError("Failed to generate unique short code")
     
-    def get_url_by_code(self, short_code: str) -> Optional[URL]:
-        """Get URL by short code, checking for expiration.
+    async def get_redirect_target(self, db: AsyncSession, short_code: str) -> Optional[RedirectTarget]:
+        """Get the redirect target for a short code, excluding expired URLs.
+        
+        Expired URLs are filtered out by the query and removed later by the
+        cleanup command, so this path never writes to the database.
+        The expiry deadline is the database's remaining time added to this
+        server's clock, so clock skew between the two doesn't shift it.
         
         Args:
+            db: Database session
             short_code: The short code to search for
             
         Returns:
-            Optional[URL]: URL object if found and not expired, None otherwise
+            Optional[RedirectTarget]: Target URL and expiry deadline if found
+            and not expired, None otherwise
         """
-        url = self.repository.get_by_short_code(short_code)
+        if self.url_cache is not None:
+            target = self.url_cache.get(short_code)
+            if target is not None:
+                return target
         
-        if url and is_url_expired(url.created_at, settings.APP_TTL_MINUTES):
-            # URL has expired, delete it
-            self.repository.delete_by_short_code(short_code)
+        generation = self._cache_generation
+        row = await self.repository.get_redirect_target(db, short_code, self._ttl_filter())
+        if row is None:
             return None
-        
-        return url
+        expires_at = None if row.expires_in is None else time.time() + float(row.expires_in)
+        target = RedirectTarget(row.original_url, expires_at)
+        if self.url_cache is not None and generation == self._cache_generation:
+            self.url_cache[short_code] = target
+        return target
     
-    def get_all_urls(self) -> List[URL]:
-        """Get all URLs, excluding expired ones.
+    def get_redirect_max_age(self, target: RedirectTarget) -> int:
+        """Get how long clients may cache a redirect to this URL.
         
+        Capped by APP_REDIRECT_CACHE_SECONDS and by the time left before
+        the URL expires, so caches never outlive the link.
+        
+        Args:
+            target: Redirect target with its expiry deadline
+            
         Returns:
-            List[URL]: List of all valid URL objects
+            int: Cache lifetime in seconds, 0 if the redirect must not be cached
         """
-        all_urls = self.repository.get_all()
-        valid_urls = []
+        max_age = settings.APP_REDIRECT_CACHE_SECONDS
+        if max_age > 0 and target.expires_at is not None:
+            max_age = min(max_age, int(target.expires_at - time.time()))
+        return max(0, max_age)
+    
+    def get_all_urls(self, db: AsyncSession) -> AsyncIterator[URL]:
+        """Get all URLs, excluding expired ones.
         
-        for url in all_urls:
-            if not is_url_expired(url.created_at, settings.APP_TTL_MINUTES):
-                valid_urls.append(url)
-            else:
-                # Delete expired URL
-                self.repository.delete_by_short_code(url.short_code)
+        URLs are streamed from the database rather than collected into a
+        list, so callers can convert each one and let it go.
         
-        return valid_urls
+        Args:
+            db: Database session
+            
+        Returns:
+            AsyncIterator[URL]: Valid URL objects, newest first
+        """
+        return self.repository.stream_all(db, self._ttl_filter())
     
-    def delete_url(self, short_code: str) -> bool:
+    async def delete_url(self, db: AsyncSession, short_code: str) -> bool:
         """Delete URL by short code.
         
         Args:
+            db: Database session
             short_code: The short code of the URL to delete
             
         Returns:
             bool: True if deleted, False if not found
         """
-        return self.repository.delete_by_short_code(short_code)
+        deleted = await self.repository.delete_by_short_code(db, short_code)
+        # Evict only once the delete is committed; lookups that read the row
+        # before then and finish later are kept out of the cache by _evict()
+        self._evict(short_code)
+        return deleted
     
-    def cleanup_expired_urls(self) -> int:
+    async def cleanup_expired_urls(self, db: AsyncSession) -> int:
         """Delete all expired URLs.
         
+        Args:
+            db: Database session
+            
+        Returns:
+            int: Number of deleted URLs (always 0 when expiration is disabled)
+        """
+        if not self.ttl_enabled:
+            return 0
+        return await self.repository.delete_expired(
+            db, settings.APP_TTL_MINUTES, settings.APP_CLEANUP_BATCH_SIZE
+        )
+    
+    def _ttl_filter(self) -> Optional[int]:
+        """Get the TTL the repository should filter reads by.
+        
         Returns:
-            int: Number of deleted URLs
+            Optional[int]: TTL in minutes, or None if expiration is disabled
+        """
+        return settings.APP_TTL_MINUTES if self.ttl_enabled else None
+    
+    def _evict(self, short_code: str) -> None:
+        """Remove a short code from the lookup cache.
+        
+        Args:
+            short_code: The short code to evict
         """
-        return self.repository.delete_expired(settings.APP_TTL_MINUTES)
+        if self.url_cache is not None:
+            self.url_cache.pop(short_code, None)
+            self._cache_generation += 1
@@ -0,0 +1,15 @@
+"""Shared pytest fixtures."""
+import os
+import sys
+
+import pytest
+
+# Make the app package importable when pytest is run from another directory
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Import the FastAPI application once per test session."""
+    from app.main import app
+    return app
@@ -80,7 +80,7 @@ fi
 # Run basic tests
 echo ""
 echo "Running basic tests..."
-if poetry run python test_basic.py > /tmp/test_output.txt 2>&1; then
+if poetry run pytest -q > /tmp/test_output.txt 2>&1; then
     echo "✅ All basic tests passed"
 else
     echo "❌ Some tests failed. Check output:"